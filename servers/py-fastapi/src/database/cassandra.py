@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import uuid
 from typing import Any
 from uuid import UUID
@@ -11,6 +10,28 @@ from cassandra.policies import AddressTranslator, DCAwareRoundRobinPolicy  # typ
 from bench_shared.repositories.cassandra import split_contact_points
 from bench_shared.schemas import CreateUser, UpdateUser, User
 
+from src.database.repository import update_mask
+
+
+_INSERT_FULL = "INSERT INTO users (id, name, email, favorite_number) VALUES (?, ?, ?, ?)"
+_INSERT_MIN = "INSERT INTO users (id, name, email) VALUES (?, ?, ?)"
+_FIND = "SELECT id, name, email, favorite_number FROM users WHERE id = ?"
+_DELETE = "DELETE FROM users WHERE id = ?"
+
+# Bit i of update_mask() selects column i; one UPDATE per non-empty mask (7 shapes), prepared at connect.
+_UPDATABLE_COLUMNS: tuple[str, ...] = ("name", "email", "favorite_number")
+
+
+def _set_list(mask: int) -> str:
+    return ", ".join(f"{c} = ?" for bit, c in enumerate(_UPDATABLE_COLUMNS) if mask >> bit & 1)
+
+
+# S608 suppressed: the SET list is built only from the static column names above; values are bound.
+_UPDATES: dict[int, str] = {
+    mask: f"UPDATE users SET {_set_list(mask)} WHERE id = ?"  # noqa: S608
+    for mask in range(1, 1 << len(_UPDATABLE_COLUMNS))
+}
+
 
 class _ContactPointAddressTranslator(AddressTranslator):
     """Pin every discovered node address to the configured contact point.
@@ -28,6 +49,24 @@ class _ContactPointAddressTranslator(AddressTranslator):
         return self._host
 
 
+def _set_result(future: asyncio.Future[Any], rows: Any) -> None:
+    if not future.done():
+        future.set_result(rows)
+
+
+def _set_exception(future: asyncio.Future[Any], exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+def _on_rows(rows: Any, loop: asyncio.AbstractEventLoop, future: asyncio.Future[Any]) -> None:
+    loop.call_soon_threadsafe(_set_result, future, rows)
+
+
+def _on_error(exc: BaseException, loop: asyncio.AbstractEventLoop, future: asyncio.Future[Any]) -> None:
+    loop.call_soon_threadsafe(_set_exception, future, exc)
+
+
 class CassandraUserRepository:
     def __init__(self, contact_points: list[str], local_dc: str, keyspace: str):
         self._contact_points = contact_points
@@ -35,7 +74,8 @@ class CassandraUserRepository:
         self._keyspace = keyspace
         self._cluster: Cluster | None = None
         self._session = None
-        self._executor = ThreadPoolExecutor(max_workers=50)
+        self._prepared: dict[str, Any] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def _connect_sync(self) -> None:
         if self._session is not None:
@@ -47,16 +87,37 @@ class CassandraUserRepository:
             load_balancing_policy=DCAwareRoundRobinPolicy(local_dc=self._local_dc),
             address_translator=_ContactPointAddressTranslator(hosts[0]),
         )
-        self._session = self._cluster.connect(self._keyspace)  # type: ignore[union-attr]
-
-    async def _connect(self) -> None:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(self._executor, self._connect_sync)
+        session = self._cluster.connect(self._keyspace)  # type: ignore[union-attr]
+        # Prepare every fixed query shape once so requests only bind values; the server skips re-parsing.
+        self._prepared = {
+            query: session.prepare(query)  # type: ignore[union-attr]
+            for query in (_INSERT_FULL, _INSERT_MIN, _FIND, _DELETE, *_UPDATES.values())
+        }
+        self._session = session
+
+    async def _connect(self) -> asyncio.AbstractEventLoop:
+        if self._session is None:
+            await asyncio.to_thread(self._connect_sync)
+        # Cached with the session: one event loop per process, so _execute needn't look it up per query.
+        self._loop = asyncio.get_running_loop()
+        return self._loop
 
     async def _execute(self, query: str, params: tuple[Any, ...] = ()) -> list[Any]:
-        await self._connect()
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, lambda: list(self._session.execute(query, params)))  # type: ignore[union-attr]
+        """Run ``query`` on the driver's IO reactor and await the result on the event loop.
+
+        Queries prepared at connect time are sent as bound statements; anything else (TRUNCATE, the
+        health probe) goes out as plain CQL. ``execute_async`` returns immediately; the driver thread
+        resolves the ResponseFuture and the callbacks only hand the result back via ``call_soon_threadsafe``.
+        """
+        loop = self._loop or await self._connect()
+        result: asyncio.Future[Any] = loop.create_future()
+        statement = self._prepared.get(query, query)
+        response_future = self._session.execute_async(statement, params)  # type: ignore[union-attr]
+        response_future.add_callbacks(  # type: ignore[union-attr]
+            _on_rows, _on_error, callback_args=(loop, result), errback_args=(loop, result)
+        )
+        rows = await result
+        return list(rows) if rows else []
 
     async def _execute_one(self, query: str, params: tuple[Any, ...] = ()) -> Any | None:
         rows = await self._execute(query, params)
@@ -72,13 +133,9 @@ class CassandraUserRepository:
         id = uuid.uuid7()
 
         if data.favoriteNumber is not None:
-            query = "INSERT INTO users (id, name, email, favorite_number) VALUES (%s, %s, %s, %s)"
-            params = (id, data.name, data.email, data.favoriteNumber)
+            await self._execute(_INSERT_FULL, (id, data.name, data.email, data.favoriteNumber))
         else:
-            query = "INSERT INTO users (id, name, email) VALUES (%s, %s, %s)"
-            params = (id, data.name, data.email)
-
-        await self._execute(query, params)
+            await self._execute(_INSERT_MIN, (id, data.name, data.email))
         return User(id=str(id), name=data.name, email=data.email, favoriteNumber=data.favoriteNumber)
 
     async def find_by_id(self, id: str) -> User | None:
@@ -86,11 +143,10 @@ class CassandraUserRepository:
         if uuid_id is None:
             return None
 
-        query = "SELECT id, name, email, favorite_number FROM users WHERE id = %s"
-        row = await self._execute_one(query, (uuid_id,))
+        row = await self._execute_one(_FIND, (uuid_id,))
         if row is None:
             return None
-        return User(id=str(row.id), name=row.name, email=row.email, favoriteNumber=row.favorite_number)
+        return User.model_construct(id=str(row.id), name=row.name, email=row.email, favoriteNumber=row.favorite_number)
 
     async def update(self, id: str, data: UpdateUser) -> User | None:
         uuid_id = self._parse_uuid(id)
@@ -101,31 +157,19 @@ class CassandraUserRepository:
         if existing is None:
             return None
 
-        set_clauses: list[str] = []
-        params: list[Any] = []
-
-        if data.name is not None:
-            set_clauses.append("name = %s")
-            params.append(data.name)
-            existing.name = data.name
-        if data.email is not None:
-            set_clauses.append("email = %s")
-            params.append(data.email)
-            existing.email = data.email
-        if data.favoriteNumber is not None:
-            set_clauses.append("favorite_number = %s")
-            params.append(data.favoriteNumber)
-            existing.favoriteNumber = data.favoriteNumber
-
-        if not set_clauses:
+        mask = update_mask(data)
+        if not mask:
             return existing
 
-        params.append(uuid_id)
-        # S608 suppressed: set_clauses holds only static "<col> = %s" literals built above; all
-        # values are bound via %s params, never interpolated — no user input reaches the SQL text.
-        query = f"UPDATE users SET {', '.join(set_clauses)} WHERE id = %s"  # noqa: S608
-        await self._execute(query, tuple(params))
-        return existing
+        # Set values in _UPDATABLE_COLUMNS order, which is exactly the mask's statement's bind order.
+        values = tuple(v for v in (data.name, data.email, data.favoriteNumber) if v is not None)
+        await self._execute(_UPDATES[mask], (*values, uuid_id))
+        return User.model_construct(
+            id=existing.id,
+            name=existing.name if data.name is None else data.name,
+            email=existing.email if data.email is None else data.email,
+            favoriteNumber=existing.favoriteNumber if data.favoriteNumber is None else data.favoriteNumber,
+        )
 
     async def delete(self, id: str) -> bool:
         uuid_id = self._parse_uuid(id)
@@ -136,8 +180,7 @@ class CassandraUserRepository:
         if existing is None:
             return False
 
-        query = "DELETE FROM users WHERE id = %s"
-        await self._execute(query, (uuid_id,))
+        await self._execute(_DELETE, (uuid_id,))
         return True
 
     async def delete_all(self) -> None:
@@ -156,4 +199,5 @@ class CassandraUserRepository:
             self._cluster.shutdown()
             self._cluster = None
             self._session = None
-        self._executor.shutdown(wait=False)
+            self._prepared = {}
+            self._loop = None
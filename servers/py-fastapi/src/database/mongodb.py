@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from bson import ObjectId
@@ -8,17 +9,25 @@ from pymongo import ReturnDocument
 
 from bench_shared.schemas import CreateUser, UpdateUser, User, build_user
 
+from src.database.repository import update_mask
+
+_SET_DOCUMENTS: dict[int, Callable[[UpdateUser], dict[str, Any]]] = {
+    0b001: lambda d: {"name": d.name},
+    0b010: lambda d: {"email": d.email},
+    0b011: lambda d: {"name": d.name, "email": d.email},
+    0b100: lambda d: {"favoriteNumber": d.favoriteNumber},
+    0b101: lambda d: {"name": d.name, "favoriteNumber": d.favoriteNumber},
+    0b110: lambda d: {"email": d.email, "favoriteNumber": d.favoriteNumber},
+    0b111: lambda d: {"name": d.name, "email": d.email, "favoriteNumber": d.favoriteNumber},
+}
+
 
 class MongoUserRepository:
     def __init__(self, connection_string: str, db_name: str):
-        self._url = connection_string
-        self._db_name = db_name
-        self._client: AsyncIOMotorClient[dict[str, Any]] | None = None
-
-    def _collection(self) -> AsyncIOMotorCollection[dict[str, Any]]:
-        if self._client is None:
-            self._client = AsyncIOMotorClient(self._url)
-        return self._client[self._db_name]["users"]
+        # AsyncIOMotorClient does no I/O on construction (it connects on first operation), so the client
+        # and collection handle are built once here instead of behind a per-call None guard.
+        self._client: AsyncIOMotorClient[dict[str, Any]] = AsyncIOMotorClient(connection_string)
+        self._users: AsyncIOMotorCollection[dict[str, Any]] = self._client[db_name]["users"]
 
     def _parse_object_id(self, id: str) -> ObjectId | None:
         try:
@@ -27,7 +36,8 @@ class MongoUserRepository:
             return None
 
     def _to_user(self, doc: dict[str, Any]) -> User:
-        return User(
+        # Rows were validated on the way in; model_construct skips re-validating trusted DB data.
+        return User.model_construct(
             id=str(doc["_id"]),
             name=doc["name"],
             email=doc["email"],
@@ -40,7 +50,7 @@ class MongoUserRepository:
         if data.favoriteNumber is not None:
             doc["favoriteNumber"] = data.favoriteNumber
 
-        await self._collection().insert_one(doc)
+        await self._users.insert_one(doc)
         return build_user(str(id), data)
 
     async def find_by_id(self, id: str) -> User | None:
@@ -48,7 +58,7 @@ class MongoUserRepository:
         if oid is None:
             return None
 
-        doc = await self._collection().find_one({"_id": oid})
+        doc = await self._users.find_one({"_id": oid})
         return self._to_user(doc) if doc else None
 
     async def update(self, id: str, data: UpdateUser) -> User | None:
@@ -56,19 +66,12 @@ class MongoUserRepository:
         if oid is None:
             return None
 
-        update_fields = {}
-        if data.name is not None:
-            update_fields["name"] = data.name
-        if data.email is not None:
-            update_fields["email"] = data.email
-        if data.favoriteNumber is not None:
-            update_fields["favoriteNumber"] = data.favoriteNumber
-
-        if not update_fields:
+        mask = update_mask(data)
+        if not mask:
             return await self.find_by_id(id)
 
-        doc = await self._collection().find_one_and_update(
-            {"_id": oid}, {"$set": update_fields}, return_document=ReturnDocument.AFTER
+        doc = await self._users.find_one_and_update(
+            {"_id": oid}, {"$set": _SET_DOCUMENTS[mask](data)}, return_document=ReturnDocument.AFTER
         )
         return self._to_user(doc) if doc else None
 
@@ -77,22 +80,18 @@ class MongoUserRepository:
         if oid is None:
             return False
 
-        result = await self._collection().delete_one({"_id": oid})
+        result = await self._users.delete_one({"_id": oid})
         return result.deleted_count > 0
 
     async def delete_all(self) -> None:
-        await self._collection().delete_many({})
+        await self._users.delete_many({})
 
     async def health_check(self) -> bool:
         try:
-            if self._client is None:
-                self._client = AsyncIOMotorClient(self._url)
             await self._client.admin.command("ping")
             return True
         except Exception:
             return False
 
     async def disconnect(self) -> None:
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        self._client.close()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import uuid as uuid_module
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import String, delete, select, text
+from sqlalchemy import String, delete, select, text, update
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -12,6 +12,7 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from bench_shared.schemas import CreateUser, UpdateUser, User
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 
@@ -31,9 +32,22 @@ class UserModel(Base):
         return User(id=str(self.id), name=self.name, email=self.email, favoriteNumber=self.favorite_number)
 
 
+# Single-row reads and RETURNING run as Core statements on a bare connection: plain Row tuples, no
+# identity map or instance state. The ORM session is kept for create, where it adds nothing measurable.
+_COLUMNS = (UserModel.id, UserModel.name, UserModel.email, UserModel.favorite_number)
+
+
+def _row_to_user(row: Row[tuple[UUID, str, str, int | None]]) -> User:
+    id, name, email, favorite_number = row
+    return User.model_construct(id=str(id), name=name, email=email, favoriteNumber=favorite_number)
+
+
 class PostgresUserRepository:
     def __init__(self, connection_string: str):
         url = connection_string.replace("postgres://", "postgresql+asyncpg://", 1)
+        # pool_size=50 is the fleet fairness canon; don't retune it per server. No pool_pre_ping: it adds a
+        # round trip to every checkout. asyncpg's per-connection prepared-statement cache (100 entries) and
+        # SQLAlchemy's compiled cache are on by default and already cover every statement issued here.
         self._engine: AsyncEngine = create_async_engine(url, pool_size=50, max_overflow=0)
         self._session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
 
@@ -59,30 +73,33 @@ class PostgresUserRepository:
         uuid_id = self._parse_uuid(id)
         if uuid_id is None:
             return None
-        async with self._session_maker() as session:
-            result = await session.execute(select(UserModel).where(UserModel.id == uuid_id))
-            user = result.scalar_one_or_none()
-            return user.to_user() if user else None
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(*_COLUMNS).where(UserModel.id == uuid_id))
+            row = result.one_or_none()
+        return _row_to_user(row) if row else None
 
     async def update(self, id: str, data: UpdateUser) -> User | None:
         uuid_id = self._parse_uuid(id)
         if uuid_id is None:
             return None
-        async with self._session_maker() as session:
-            result = await session.execute(select(UserModel).where(UserModel.id == uuid_id))
-            user = result.scalar_one_or_none()
-            if user is None:
-                return None
-
-            if data.name is not None:
-                user.name = data.name
-            if data.email is not None:
-                user.email = data.email
-            if data.favoriteNumber is not None:
-                user.favorite_number = data.favoriteNumber
 
-            await session.commit()
-            return user.to_user()
+        values: dict[str, Any] = {}
+        if data.name is not None:
+            values["name"] = data.name
+        if data.email is not None:
+            values["email"] = data.email
+        if data.favoriteNumber is not None:
+            values["favorite_number"] = data.favoriteNumber
+
+        if not values:
+            return await self.find_by_id(id)
+
+        # UPDATE ... RETURNING learns existence and the new row in one round trip; no pre-SELECT.
+        stmt = update(UserModel).where(UserModel.id == uuid_id).values(values).returning(*_COLUMNS)
+        async with self._engine.begin() as conn:
+            result = await conn.execute(stmt)
+            row = result.one_or_none()
+        return _row_to_user(row) if row else None
 
     async def delete(self, id: str) -> bool:
         uuid_id = self._parse_uuid(id)
@@ -2,26 +2,82 @@ from __future__ import annotations
 
 import uuid
 
+from collections.abc import Callable
 from typing import Any
 
 import redis.asyncio as aioredis
 
 from bench_shared.schemas import CreateUser, UpdateUser, User, build_user
 
+from src.database.repository import update_mask
+
+
+_FIELDS = ["name", "email", "favoriteNumber"]
+
+# HSET field/value pairs per update_mask; mask 0 sends no pairs and the script just reads back.
+_HSET_ARGS: dict[int, Callable[[UpdateUser], list[Any]]] = {
+    0b000: lambda d: [],
+    0b001: lambda d: ["name", d.name],
+    0b010: lambda d: ["email", d.email],
+    0b011: lambda d: ["name", d.name, "email", d.email],
+    0b100: lambda d: ["favoriteNumber", str(d.favoriteNumber)],
+    0b101: lambda d: ["name", d.name, "favoriteNumber", str(d.favoriteNumber)],
+    0b110: lambda d: ["email", d.email, "favoriteNumber", str(d.favoriteNumber)],
+    0b111: lambda d: ["name", d.name, "email", d.email, "favoriteNumber", str(d.favoriteNumber)],
+}
+
+# Patch-and-read-back in one round trip: never creates a missing hash, returns nil if the key is absent.
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return nil end
+if #ARGV > 0 then redis.call('HSET', KEYS[1], unpack(ARGV)) end
+return redis.call('HMGET', KEYS[1], 'name', 'email', 'favoriteNumber')
+"""
+
+# Server-side SCAN + UNLINK loop: the whole reset is one round trip and memory is freed off the main thread.
+_DELETE_ALL_SCRIPT = """
+local cursor = '0'
+repeat
+  local page = redis.call('SCAN', cursor, 'MATCH', ARGV[1], 'COUNT', 500)
+  cursor = page[1]
+  if #page[2] > 0 then redis.call('UNLINK', unpack(page[2])) end
+until cursor == '0'
+"""
+
 
 def _decode(value: bytes | str) -> str:
     return value.decode() if isinstance(value, bytes) else value
 
 
+def _to_user(id: str, values: list[Any]) -> User | None:
+    """Build a User from an HMGET of ``_FIELDS``; None if the hash is missing or malformed."""
+    name, email, raw_favorite = values
+    if name is None or email is None:
+        return None
+
+    favorite_number = None
+    if raw_favorite is not None:
+        try:
+            favorite_number = int(_decode(raw_favorite))
+        except ValueError:
+            return None
+
+    return User.model_construct(id=id, name=_decode(name), email=_decode(email), favoriteNumber=favorite_number)
+
+
 class RedisUserRepository:
     def __init__(self, connection_string: str):
         self._url = connection_string
         self._client: Any = None
+        self._update_script: Any = None
+        self._delete_all_script: Any = None
         self._prefix = "user:"
 
     async def _ensure_client(self) -> Any:
         if self._client is None:
             self._client = aioredis.from_url(self._url)
+            # register_script runs EVALSHA and falls back to EVAL (loading the script) on NOSCRIPT.
+            self._update_script = self._client.register_script(_UPDATE_SCRIPT)
+            self._delete_all_script = self._client.register_script(_DELETE_ALL_SCRIPT)
         return self._client
 
     def _key(self, id: str) -> str:
@@ -39,56 +95,23 @@ class RedisUserRepository:
 
     async def find_by_id(self, id: str) -> User | None:
         client = await self._ensure_client()
-        key = self._key(id)
-        if not await client.exists(key):
-            return None
-
-        result = await client.hmget(key, ["name", "email", "favoriteNumber"])
-        if result[0] is None or result[1] is None:
-            return None
-
-        favorite_number = None
-        if result[2] is not None:
-            try:
-                favorite_number = int(_decode(result[2]))
-            except ValueError:
-                return None
-
-        return User(id=id, name=_decode(result[0]), email=_decode(result[1]), favoriteNumber=favorite_number)
+        # A missing hash reads back as all-None, which _to_user already maps to None; no EXISTS probe.
+        return _to_user(id, await client.hmget(self._key(id), _FIELDS))
 
     async def update(self, id: str, data: UpdateUser) -> User | None:
-        client = await self._ensure_client()
-        key = self._key(id)
-        if not await client.exists(key):
-            return None
-
-        fields: dict[str, str] = {}
-        if data.name is not None:
-            fields["name"] = data.name
-        if data.email is not None:
-            fields["email"] = data.email
-        if data.favoriteNumber is not None:
-            fields["favoriteNumber"] = str(data.favoriteNumber)
-
-        if fields:
-            await client.hset(key, mapping=fields)
-
-        return await self.find_by_id(id)
+        await self._ensure_client()
+        args = _HSET_ARGS[update_mask(data)](data)
+        values = await self._update_script(keys=[self._key(id)], args=args)
+        return None if values is None else _to_user(id, values)
 
     async def delete(self, id: str) -> bool:
         client = await self._ensure_client()
-        deleted = await client.delete(self._key(id))
+        deleted = await client.unlink(self._key(id))
         return deleted > 0
 
     async def delete_all(self) -> None:
-        client = await self._ensure_client()
-        cursor = 0
-        while True:
-            cursor, keys = await client.scan(cursor, match=f"{self._prefix}*", count=100)
-            if keys:
-                await client.delete(*keys)
-            if cursor == 0:
-                break
+        await self._ensure_client()
+        await self._delete_all_script(args=[f"{self._prefix}*"])
 
     async def health_check(self) -> bool:
         try:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from typing import Literal, Protocol
 
 from bench_shared.env import env
 from bench_shared.schemas import CreateUser, UpdateUser, User
 
 DatabaseType = Literal["postgres", "mongodb", "redis", "cassandra"]
-DATABASE_TYPES: list[DatabaseType] = ["postgres", "mongodb", "redis", "cassandra"]
+DATABASE_TYPES: tuple[DatabaseType, ...] = ("postgres", "mongodb", "redis", "cassandra")
 
 
 class UserRepository(Protocol):
@@ -20,50 +21,74 @@ class UserRepository(Protocol):
     async def disconnect(self) -> None: ...
 
 
-_repositories: dict[DatabaseType, UserRepository] = {}
+def update_mask(data: UpdateUser) -> int:
+    """Bitmask of the fields a PATCH sets: name=0b001, email=0b010, favoriteNumber=0b100.
 
+    Backends key their pre-shaped update documents/statements on it (7 non-empty shapes), so an update
+    is one table lookup instead of a chain of ``is not None`` checks growing a dict or list.
+    """
+    return (data.name is not None) | (data.email is not None) << 1 | (data.favoriteNumber is not None) << 2
 
-def get_repository(database: DatabaseType) -> UserRepository:
-    if database in _repositories:
-        return _repositories[database]
 
-    repo: UserRepository
-    if database == "postgres":
-        from src.database.postgres import PostgresUserRepository
+# Filled by initialize_databases() inside the lifespan, so every client binds to the serving event loop;
+# routes/db.py reads it per request. Public for that one lookup.
+repositories: dict[DatabaseType, UserRepository] = {}
 
-        repo = PostgresUserRepository(env.POSTGRES_URL)
-    elif database == "mongodb":
-        from src.database.mongodb import MongoUserRepository
 
-        repo = MongoUserRepository(env.MONGODB_URL, env.MONGODB_DB)
-    elif database == "redis":
-        from src.database.redis_repo import RedisUserRepository
+# Backend modules are imported only when get_repository() first builds that backend (at lifespan
+# startup), not when this module is imported.
+def _postgres() -> UserRepository:
+    from src.database.postgres import PostgresUserRepository
 
-        repo = RedisUserRepository(env.REDIS_URL)
-    elif database == "cassandra":
-        from src.database.cassandra import CassandraUserRepository
+    return PostgresUserRepository(env.POSTGRES_URL)
 
-        repo = CassandraUserRepository(
-            env.CASSANDRA_CONTACT_POINTS, env.CASSANDRA_LOCAL_DATACENTER, env.CASSANDRA_KEYSPACE
-        )
-    else:
-        raise ValueError(f"Unknown database type: {database}")
 
-    _repositories[database] = repo
-    return repo
+def _mongodb() -> UserRepository:
+    from src.database.mongodb import MongoUserRepository
+
+    return MongoUserRepository(env.MONGODB_URL, env.MONGODB_DB)
+
+
+def _redis() -> UserRepository:
+    from src.database.redis_repo import RedisUserRepository
+
+    return RedisUserRepository(env.REDIS_URL)
+
 
+def _cassandra() -> UserRepository:
+    from src.database.cassandra import CassandraUserRepository
 
-def resolve_repository(database: str) -> UserRepository | None:
-    if database not in DATABASE_TYPES:
-        return None
-    return get_repository(database)  # type: ignore[arg-type]
+    return CassandraUserRepository(env.CASSANDRA_CONTACT_POINTS, env.CASSANDRA_LOCAL_DATACENTER, env.CASSANDRA_KEYSPACE)
+
+
+_FACTORIES: dict[DatabaseType, Callable[[], UserRepository]] = {
+    "postgres": _postgres,
+    "mongodb": _mongodb,
+    "redis": _redis,
+    "cassandra": _cassandra,
+}
+
+
+def get_repository(database: DatabaseType) -> UserRepository:
+    repo = repositories.get(database)
+    if repo is not None:
+        return repo
+
+    factory = _FACTORIES.get(database)
+    if factory is None:
+        raise ValueError(f"Unknown database type: {database}")
+    repo = repositories[database] = factory()
+    return repo
 
 
 async def initialize_databases() -> None:
-    await asyncio.gather(*[get_repository(db).health_check() for db in DATABASE_TYPES])
+    # health_check() never raises (it reports failure as False), so the group only ever waits for all four.
+    async with asyncio.TaskGroup() as tg:
+        for db in DATABASE_TYPES:
+            tg.create_task(get_repository(db).health_check())
 
 
 async def disconnect_databases() -> None:
-    for repo in _repositories.values():
+    for repo in repositories.values():
         await repo.disconnect()
-    _repositories.clear()
+    repositories.clear()
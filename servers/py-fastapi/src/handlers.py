@@ -1,31 +1,69 @@
+from collections.abc import Mapping
+from typing import Any
+
 from fastapi import Request
-from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
 
-from bench_shared.errors import INTERNAL_ERROR, INVALID_JSON_BODY, NOT_FOUND, make_error
+from bench_shared.errors import (
+    INTERNAL_ERROR,
+    INVALID_JSON_BODY,
+    NOT_FOUND,
+    ErrorResponse,
+    make_error,
+    make_error_from_exc,
+)
+from bench_shared.web import summarize_validation_error
 
 
-async def validation_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(status_code=400, content=make_error(INVALID_JSON_BODY, exc))
+def error_response(status_code: int, content: Mapping[str, Any]) -> Response:
+    """JSON error body serialized by pydantic-core's Rust encoder (compact UTF-8, like JSONResponse's output)."""
+    return Response(to_json(content), status_code=status_code, media_type="application/json")
+
+
+# Constant bodies for the detail-less 404/500 paths, serialized once; a Response carries no per-request
+# state, so the same instance is safe to hand out on every request.
+_NOT_FOUND_RESPONSE = error_response(404, make_error(NOT_FOUND))
+_INTERNAL_ERROR_RESPONSE = error_response(500, make_error(INTERNAL_ERROR))
 
 
-async def not_found_exception_handler(request: Request, exc: Exception):
-    if isinstance(exc, StarletteHTTPException):
-        if exc.status_code == 404:
-            detail = exc.detail if exc.detail and exc.detail != "Not Found" else None
-            return JSONResponse(status_code=404, content=make_error(NOT_FOUND, detail))
-        return JSONResponse(status_code=exc.status_code, content={"error": exc.detail})
-    return JSONResponse(status_code=500, content=make_error(INTERNAL_ERROR))
+async def validation_exception_handler(request: Request, exc: Exception):
+    return error_response(400, make_error_from_exc(INVALID_JSON_BODY, exc))
 
 
 async def http_exception_handler(request: Request, exc: Exception):
-    if isinstance(exc, HTTPException):
-        if isinstance(exc.detail, dict) and "error" in exc.detail:
-            return JSONResponse(status_code=exc.status_code, content=exc.detail)
-        return JSONResponse(status_code=exc.status_code, content={"error": exc.detail})
-    return JSONResponse(status_code=500, content=make_error(INTERNAL_ERROR))
+    # One handler for both HTTPException flavours (FastAPI's subclasses Starlette's): route-raised errors
+    # carry a ready make_error dict, router-level 404/405s carry Starlette's plain-string detail.
+    if not isinstance(exc, StarletteHTTPException):
+        return _INTERNAL_ERROR_RESPONSE
+    detail = exc.detail
+    if isinstance(detail, dict) and "error" in detail:
+        return error_response(exc.status_code, detail)
+    if exc.status_code == 404:
+        if not detail or detail == "Not Found":
+            return _NOT_FOUND_RESPONSE
+        return error_response(404, make_error(NOT_FOUND, detail))
+    return error_response(exc.status_code, {"error": detail})
+
+
+def internal_error_detail(exc: BaseException) -> ErrorResponse:
+    """500 body for an unexpected exception, shared by the global handler and the db routes' 500 wraps.
+
+    A stray pydantic ValidationError is summarized by count (as /validate does) rather than str()'d
+    with every input and docs URL; an exception without args has nothing worth reporting, so its
+    __str__ is skipped altogether.
+    """
+    if isinstance(exc, ValidationError):
+        return {"error": INTERNAL_ERROR, "details": summarize_validation_error(exc)}
+    if not exc.args:
+        return {"error": INTERNAL_ERROR}
+    return make_error_from_exc(INTERNAL_ERROR, exc)
 
 
 async def general_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(status_code=500, content=make_error(INTERNAL_ERROR, exc))
+    detail = internal_error_detail(exc)
+    if "details" not in detail:
+        return _INTERNAL_ERROR_RESPONSE
+    return error_response(500, detail)
@@ -1,99 +1,143 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ValidationError
 
-from bench_shared.errors import INTERNAL_ERROR, NOT_FOUND, make_error
-from bench_shared.schemas import CreateUser, UpdateUser
+from bench_shared.errors import INVALID_JSON_BODY, NOT_FOUND, make_error, make_error_from_exc
+from bench_shared.schemas import CreateUser, UpdateUser, User
 
-from src.database.repository import UserRepository, resolve_repository
+from src.database.repository import DatabaseType, repositories
+from src.handlers import internal_error_detail
 
-db_router = APIRouter()
+
+async def _parse_body[M: BaseModel](request: Request, model: type[M]) -> M:
+    # Raw bytes straight into pydantic-core's JSON validator: one parse+validate pass instead of FastAPI's
+    # json.loads -> dict -> model body-param path. Same 400 "invalid JSON body" + details as the global handler.
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=make_error_from_exc(INVALID_JSON_BODY, e)) from e
 
 
-def _require_repo(database: str) -> UserRepository:
-    repo = resolve_repository(database)
-    if repo is None:
-        raise HTTPException(status_code=404, detail=make_error(NOT_FOUND, f"unknown database type: {database}"))
-    return repo
+# Health probes answer with one of two fixed bodies; built once and shared like main.py's _HELLO/_OK.
+_HEALTHY = Response(content=b"OK", media_type="text/plain")
+_UNAVAILABLE = Response(content=b"Service Unavailable", status_code=503, media_type="text/plain")
 
 
 def _not_found(id: str) -> HTTPException:
     return HTTPException(status_code=404, detail=make_error(NOT_FOUND, f"user with id {id} not found"))
 
 
-@db_router.get("/{database}/health")
-async def database_health(database: str):
-    repo = resolve_repository(database)
-    if repo is None:
-        return Response(content="Service Unavailable", status_code=503, media_type="text/plain")
+def make_db_router(name: DatabaseType) -> APIRouter:
+    """Routes for one backend, closed over its name; main.py mounts one copy per name at ``/db/<name>``.
+
+    A request is routed straight to its backend's handlers with no ``{database}`` path param to resolve;
+    each handler does a single ``repositories[name]`` read. The repository itself is looked up per request,
+    not captured, because it only exists between lifespan startup and shutdown.
+    """
+
+    async def database_health() -> Response:
+        return _HEALTHY if await repositories[name].health_check() else _UNAVAILABLE
+
+    async def create_user(request: Request) -> User:
+        repo = repositories[name]
+        data = await _parse_body(request, CreateUser)
+        try:
+            return await repo.create(data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
+
+    async def get_user(id: str) -> User:
+        repo = repositories[name]
+        try:
+            user = await repo.find_by_id(id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
+        if user is None:
+            raise _not_found(id)
+        return user
+
+    async def update_user(id: str, request: Request) -> User:
+        repo = repositories[name]
+        data = await _parse_body(request, UpdateUser)
+        try:
+            user = await repo.update(id, data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
+        if user is None:
+            raise _not_found(id)
+        return user
+
+    async def delete_user(id: str) -> dict[str, bool]:
+        repo = repositories[name]
+        try:
+            deleted = await repo.delete(id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
+        if not deleted:
+            raise _not_found(id)
+        return {"success": True}
 
-    healthy = await repo.health_check()
-    if healthy:
-        return Response(content="OK", media_type="text/plain")
-    return Response(content="Service Unavailable", status_code=503, media_type="text/plain")
+    async def delete_all_users() -> dict[str, bool]:
+        repo = repositories[name]
+        try:
+            await repo.delete_all()
+            return {"success": True}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
 
+    async def reset_database() -> dict[str, str]:
+        repo = repositories[name]
+        try:
+            await repo.delete_all()
+            return {"status": "ok"}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=internal_error_detail(e)) from e
 
-@db_router.post("/{database}/users", status_code=201)
-async def create_user(database: str, data: CreateUser):
-    repo = _require_repo(database)
-    try:
-        user = await repo.create(data)
-        return user.model_dump(exclude_none=True)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
+    router = APIRouter()
+    router.add_api_route("/health", database_health, methods=["GET"])
+    router.add_api_route("/users", create_user, methods=["POST"], status_code=201, response_model_exclude_none=True)
+    router.add_api_route("/users/{id}", get_user, methods=["GET"], response_model_exclude_none=True)
+    router.add_api_route("/users/{id}", update_user, methods=["PATCH"], response_model_exclude_none=True)
+    router.add_api_route("/users/{id}", delete_user, methods=["DELETE"])
+    router.add_api_route("/users", delete_all_users, methods=["DELETE"])
+    router.add_api_route("/reset", reset_database, methods=["DELETE"])
+    return router
 
 
-@db_router.get("/{database}/users/{id}")
-async def get_user(database: str, id: str):
-    repo = _require_repo(database)
-    try:
-        user = await repo.find_by_id(id)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
-    if user is None:
-        raise _not_found(id)
-    return user.model_dump(exclude_none=True)
+# Fallback for names that aren't one of the four mounted backends. Mounted after them, so it only
+# ever sees unknown databases: health reports 503, every users route 404s with the contract detail.
+unknown_db_router = APIRouter()
 
 
-@db_router.patch("/{database}/users/{id}")
-async def update_user(database: str, id: str, data: UpdateUser):
-    repo = _require_repo(database)
-    try:
-        user = await repo.update(id, data)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
-    if user is None:
-        raise _not_found(id)
-    return user.model_dump(exclude_none=True)
+def _unknown_database(database: str) -> HTTPException:
+    return HTTPException(status_code=404, detail=make_error(NOT_FOUND, f"unknown database type: {database}"))
 
 
-@db_router.delete("/{database}/users/{id}")
-async def delete_user(database: str, id: str):
-    repo = _require_repo(database)
-    try:
-        deleted = await repo.delete(id)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
-    if not deleted:
-        raise _not_found(id)
-    return {"success": True}
+@unknown_db_router.get("/{database}/health")
+async def unknown_database_health(database: str) -> Response:
+    return _UNAVAILABLE
 
 
-@db_router.delete("/{database}/users")
-async def delete_all_users(database: str):
-    repo = _require_repo(database)
-    try:
-        await repo.delete_all()
-        return {"success": True}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
+@unknown_db_router.post("/{database}/users")
+async def unknown_database_create(database: str, request: Request) -> None:
+    await _parse_body(request, CreateUser)
+    raise _unknown_database(database)
 
 
-@db_router.delete("/{database}/reset")
-async def reset_database(database: str):
-    repo = _require_repo(database)
-    try:
-        await repo.delete_all()
-        return {"status": "ok"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=make_error(INTERNAL_ERROR, e)) from e
+@unknown_db_router.patch("/{database}/users/{id}")
+async def unknown_database_update(database: str, id: str, request: Request) -> None:
+    await _parse_body(request, UpdateUser)
+    raise _unknown_database(database)
+
+
+@unknown_db_router.get("/{database}/users/{id}")
+@unknown_db_router.delete("/{database}/users/{id}")
+async def unknown_database_user(database: str, id: str) -> None:
+    raise _unknown_database(database)
+
+
+@unknown_db_router.delete("/{database}/users")
+@unknown_db_router.delete("/{database}/reset")
+async def unknown_database_bulk(database: str) -> None:
+    raise _unknown_database(database)
@@ -1,7 +1,8 @@
 from typing import Any
 
-from fastapi import APIRouter, Body, Cookie, File, Header, Request, Response, UploadFile
+from fastapi import APIRouter, File, Request, Response, UploadFile
 from fastapi.exceptions import HTTPException
+from pydantic_core import from_json
 
 from bench_shared.consts import DEFAULT_LIMIT, MAX_FILE_BYTES, NULL_BYTE, SAFE_INT_LIMIT, SNIFF_LEN
 from bench_shared.errors import (
@@ -15,72 +16,113 @@ from bench_shared.errors import (
     INVALID_MULTIPART,
     ONLY_TEXT_PLAIN,
     make_error,
+    make_error_from_exc,
 )
 
 
 params_router = APIRouter()
 
+# Error bodies whose details never vary, built once; the handlers only serialize them.
+_ERR_NOT_AN_OBJECT = make_error(INVALID_JSON_BODY, "expected a JSON object")
+_ERR_FORM_CONTENT_TYPE = make_error(INVALID_FORM_DATA, EXPECTED_FORM_CONTENT_TYPE)
+_ERR_MULTIPART_CONTENT_TYPE = make_error(INVALID_MULTIPART, EXPECTED_MULTIPART_CONTENT_TYPE)
+_ERR_NO_FILE_FIELD = make_error(FILE_NOT_FOUND, "no file field named 'file' in form data")
+_ERR_NULL_BYTES_IN_HEADER = make_error(FILE_NOT_TEXT, "file contains null bytes in header")
+_ERR_NULL_BYTES = make_error(FILE_NOT_TEXT, "file contains null bytes")
+_ERR_NOT_UTF8 = make_error(FILE_NOT_TEXT, "file is not valid UTF-8")
+
 
 def _strip_or(value: str | None, default: str) -> str:
-    stripped = value.strip() if value else ""
-    return stripped or default
+    if not value:
+        return default
+    # Most values have no surrounding whitespace: two char probes answer that without calling strip().
+    # isspace() is the same predicate strip() trims by, so the result is identical.
+    if not (value[0].isspace() or value[-1].isspace()):
+        return value
+    return value.strip() or default
+
+
+_FORM_MEDIA_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+_MULTIPART_MEDIA_TYPES = ("multipart/form-data",)
+
+
+def _has_media_type(request: Request, prefixes: tuple[str, ...]) -> bool:
+    # Clients send the canonical lowercase type, so try the header as-is first; only a miss pays for lower().
+    content_type = request.headers.get("content-type", "")
+    return content_type.startswith(prefixes) or content_type.lower().startswith(prefixes)
+
+
+# SAFE_INT_LIMIT (2**53 - 1) has 16 digits, so anything longer is out of range before int() runs.
+_SAFE_INT_DIGITS = len(str(SAFE_INT_LIMIT))
 
 
 def _parse_safe_int(value: str | None, default: int) -> int:
-    if value is None or "." in value:
+    # Shape-check with C-level str predicates so int() only ever sees ASCII digits: no ValueError raised
+    # and caught on the fallback path ("abc", "3.5"). The length bound applies to the significant digits,
+    # so zero-padded values ("0005") still parse.
+    if not value:
         return default
-    try:
-        num = int(value)
-        if -SAFE_INT_LIMIT <= num <= SAFE_INT_LIMIT:
-            return num
-    except ValueError:
-        pass
-    return default
+    digits = value.strip()
+    sign = digits[:1]
+    if sign in ("-", "+"):
+        digits = digits[1:]
+    if not (digits.isascii() and digits.isdigit()):
+        return default
+    digits = digits.lstrip("0")
+    if len(digits) > _SAFE_INT_DIGITS:
+        return default
+    num = int(digits) if digits else 0
+    if sign == "-":
+        num = -num
+    return num if -SAFE_INT_LIMIT <= num <= SAFE_INT_LIMIT else default
 
 
+# /search, /header and /cookie read Starlette's already-parsed query/header/cookie mappings off the
+# Request directly: a plain .get() per value instead of FastAPI's per-param model-field resolution.
 @params_router.get("/search")
-async def search_params(q: str | None = None, limit: str | None = None):
-    return {"search": _strip_or(q, "none"), "limit": _parse_safe_int(limit, DEFAULT_LIMIT)}
+async def search_params(request: Request) -> dict[str, str | int]:
+    query = request.query_params
+    return {"search": _strip_or(query.get("q"), "none"), "limit": _parse_safe_int(query.get("limit"), DEFAULT_LIMIT)}
 
 
 @params_router.get("/url/{dynamic}")
-async def url_params(dynamic: str):
+async def url_params(dynamic: str) -> dict[str, str]:
     return {"dynamic": dynamic}
 
 
 @params_router.get("/header")
-async def header_params(
-    header: str | None = Header(alias="X-Custom-Header", default=None),
-):
-    return {"header": _strip_or(header, "none")}
+async def header_params(request: Request) -> dict[str, str]:
+    return {"header": _strip_or(request.headers.get("x-custom-header"), "none")}
 
 
 @params_router.post("/body")
-async def body_params(body: Any = Body()) -> dict[str, Any]:
+async def body_params(request: Request) -> dict[str, Any]:
+    # pydantic-core's Rust JSON parser straight off the raw bytes, in place of FastAPI's Body() path
+    # (json.loads plus a model field validating Any). Last-wins duplicate keys and big ints match json.loads.
+    try:
+        body = from_json(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=make_error_from_exc(INVALID_JSON_BODY, e)) from e
     if not isinstance(body, dict):
-        raise HTTPException(status_code=400, detail=make_error(INVALID_JSON_BODY, "expected a JSON object"))
+        raise HTTPException(status_code=400, detail=_ERR_NOT_AN_OBJECT)
     return {"body": body}
 
 
+# The /cookie Set-Cookie never varies: the exact bytes Starlette's
+# set_cookie(key="bar", value="12345", max_age=10, httponly=True, path="/") renders, built once.
+_SET_COOKIE = (b"set-cookie", b"bar=12345; HttpOnly; Max-Age=10; Path=/; SameSite=lax")
+
+
 @params_router.get("/cookie")
-async def cookie_params(
-    response: Response,
-    foo: str | None = Cookie(default=None),
-):
-    response.set_cookie(key="bar", value="12345", max_age=10, httponly=True, path="/")
-    return {"cookie": _strip_or(foo, "none")}
+async def cookie_params(request: Request, response: Response) -> dict[str, str]:
+    response.raw_headers.append(_SET_COOKIE)
+    return {"cookie": _strip_or(request.cookies.get("foo"), "none")}
 
 
 @params_router.post("/form")
-async def form_params(request: Request):
-    content_type = request.headers.get("content-type", "").lower()
-    if not (
-        content_type.startswith("application/x-www-form-urlencoded") or content_type.startswith("multipart/form-data")
-    ):
-        raise HTTPException(
-            status_code=400,
-            detail=make_error(INVALID_FORM_DATA, EXPECTED_FORM_CONTENT_TYPE),
-        )
+async def form_params(request: Request) -> dict[str, str | int]:
+    if not _has_media_type(request, _FORM_MEDIA_TYPES):
+        raise HTTPException(status_code=400, detail=_ERR_FORM_CONTENT_TYPE)
 
     try:
         form = await request.form()
@@ -98,49 +140,44 @@ async def form_params(request: Request):
     return {"name": name, "age": age}
 
 
+def _file_too_large(size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=make_error(FILE_SIZE_EXCEEDS, f"file size {size} exceeds limit {MAX_FILE_BYTES}"),
+    )
+
+
 @params_router.post("/file")
-async def file_params(request: Request, file: UploadFile | None = File(default=None)):
-    content_type = request.headers.get("content-type", "").lower()
-    if not content_type.startswith("multipart/form-data"):
-        raise HTTPException(status_code=400, detail=make_error(INVALID_MULTIPART, EXPECTED_MULTIPART_CONTENT_TYPE))
+async def file_params(request: Request, file: UploadFile | None = File(default=None)) -> dict[str, str | int | None]:
+    if not _has_media_type(request, _MULTIPART_MEDIA_TYPES):
+        raise HTTPException(status_code=400, detail=_ERR_MULTIPART_CONTENT_TYPE)
 
     if file is None:
-        raise HTTPException(
-            status_code=400, detail=make_error(FILE_NOT_FOUND, "no file field named 'file' in form data")
-        )
+        raise HTTPException(status_code=400, detail=_ERR_NO_FILE_FIELD)
 
     if not file.content_type or not file.content_type.startswith("text/plain"):
         raise HTTPException(
             status_code=415, detail=make_error(ONLY_TEXT_PLAIN, f"received mimetype: {file.content_type or 'unknown'}")
         )
 
+    # Starlette has already spooled the part and counted its bytes while parsing, so an oversize upload is
+    # rejected before any of it is read back. The bounded read stays as the guard when no size was recorded.
+    if file.size is not None and file.size > MAX_FILE_BYTES:
+        raise _file_too_large(file.size)
     data = await file.read(MAX_FILE_BYTES + 1)
     if len(data) > MAX_FILE_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=make_error(FILE_SIZE_EXCEEDS, f"file size {len(data)} exceeds limit {MAX_FILE_BYTES}"),
-        )
+        raise _file_too_large(len(data))
 
-    head = data[:SNIFF_LEN]
-    if NULL_BYTE in head:
-        raise HTTPException(
-            status_code=415,
-            detail=make_error(FILE_NOT_TEXT, "file contains null bytes in header"),
-        )
-
-    if NULL_BYTE in data:
-        raise HTTPException(
-            status_code=415,
-            detail=make_error(FILE_NOT_TEXT, "file contains null bytes"),
-        )
+    # One memchr-backed find over the whole buffer; the first NUL's offset says whether it sits in the
+    # SNIFF_LEN head window, so the head needs no separate slice + scan.
+    nul = data.find(NULL_BYTE)
+    if nul != -1:
+        raise HTTPException(status_code=415, detail=_ERR_NULL_BYTES_IN_HEADER if nul < SNIFF_LEN else _ERR_NULL_BYTES)
 
     try:
         content = data.decode("utf-8")
     except UnicodeDecodeError as e:
-        raise HTTPException(
-            status_code=415,
-            detail=make_error(FILE_NOT_TEXT, "file is not valid UTF-8"),
-        ) from e
+        raise HTTPException(status_code=415, detail=_ERR_NOT_UTF8) from e
 
     return {
         "filename": file.filename,
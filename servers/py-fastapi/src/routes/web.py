@@ -10,7 +10,7 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.templating import Jinja2Templates
 
 from bench_shared.env import env
-from bench_shared.errors import INVALID_N, INVALID_TOKEN, VALIDATION_FAILED, make_error
+from bench_shared.errors import INVALID_N, INVALID_TOKEN, VALIDATION_FAILED, make_error, make_error_from_exc
 from bench_shared.web import (
     COMPUTE_CAP,
     JWT_ADMIN,
@@ -28,6 +28,11 @@ _templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates
 _BEARER_PREFIX = "Bearer "
 
 
+def warm_templates() -> None:
+    """Load and compile the /html template at startup; Jinja otherwise parses it on the first request."""
+    _templates.get_template("page.html")
+
+
 @web_router.get("/html")
 async def html(request: Request):
     # Server-rendered Jinja2 template (text/html) — the FastAPI/Starlette
@@ -40,7 +45,7 @@ async def html(request: Request):
 
 
 @web_router.get("/jwt/sign")
-async def jwt_sign():
+async def jwt_sign() -> dict[str, str]:
     now = datetime.now(UTC)
     payload: dict[str, Any] = {
         "sub": JWT_SUBJECT,
@@ -57,7 +62,7 @@ async def jwt_sign():
 
 
 @web_router.get("/jwt/verify")
-async def jwt_verify(request: Request):
+async def jwt_verify(request: Request) -> dict[str, Any]:
     header = request.headers.get("Authorization", "")
     if not header.startswith(_BEARER_PREFIX):
         raise HTTPException(status_code=401, detail=make_error(INVALID_TOKEN, "missing bearer token"))
@@ -67,12 +72,12 @@ async def jwt_verify(request: Request):
         # wrong-signature or expired token both raise InvalidTokenError -> 401.
         payload: dict[str, Any] = jwt.decode(token, env.JWT_SECRET, algorithms=["HS256"])  # pyright: ignore[reportUnknownMemberType]
     except jwt.InvalidTokenError as e:
-        raise HTTPException(status_code=401, detail=make_error(INVALID_TOKEN, e)) from e
+        raise HTTPException(status_code=401, detail=make_error_from_exc(INVALID_TOKEN, e)) from e
     return payload
 
 
 @web_router.post("/validate")
-async def validate(request: Request):
+async def validate(request: Request) -> dict[str, bool]:
     # The typed-body-param path would raise RequestValidationError -> the global
     # handler's "invalid JSON body" string, not the canon "validation failed"; so
     # read the raw body and run the shared validator, mirroring Flask/Django.
@@ -83,7 +88,7 @@ async def validate(request: Request):
 
 
 @web_router.get("/compute")
-def compute(n: str | None = None):
+def compute(n: str | None = None) -> dict[str, str]:
     # Sync def (not async) on purpose: the SHA-256 chain is CPU-bound up to
     # COMPUTE_CAP (1e6) rounds (~sub-second). FastAPI runs plain `def` routes in its
     # threadpool (guide §4.22), so a heavy /compute never freezes the single event
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-import ipaddress
 import os
+import socket
+from dataclasses import field
 from typing import Literal
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import ConfigDict, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
 
 load_dotenv()
 
 
-class Env(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
+# Validated once at import by pydantic, then a frozen slotted dataclass: `env.X` on
+# the request path is a plain slot read, not a BaseModel attribute lookup.
+@dataclass(config=ConfigDict(extra="ignore"), slots=True, frozen=True)
+class Env:
     ENV: Literal["dev", "prod"] = "dev"
     # S104: binding all interfaces is the deliberate container default for every
     # server in the fleet (the HOST env contract) — not an accidental exposure.
@@ -22,7 +25,7 @@ class Env(BaseModel):
     MONGODB_URL: str = "mongodb://localhost:20002"
     MONGODB_DB: str = "benchmarks"
     REDIS_URL: str = "redis://localhost:20003"
-    CASSANDRA_CONTACT_POINTS: list[str] = ["localhost:20004"]
+    CASSANDRA_CONTACT_POINTS: list[str] = field(default_factory=lambda: ["localhost:20004"])
     CASSANDRA_LOCAL_DATACENTER: str = "datacenter1"
     CASSANDRA_KEYSPACE: str = "benchmarks"
     # Shared HS256 secret for the web suite (/jwt/sign, /jwt/verify). The dev
@@ -41,11 +44,14 @@ class Env(BaseModel):
     def validate_host(cls, value: str) -> str:
         if value == "localhost":
             return "0.0.0.0"  # noqa: S104  (deliberate bind-all default, see HOST field)
-        try:
-            ipaddress.ip_address(value)
-        except ValueError:
-            raise ValueError("HOST must be a valid IP or 'localhost'") from None
-        return value
+        # inet_pton is libc's strict parser: no address object is built just to validate.
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, value)
+            except OSError:
+                continue
+            return value
+        raise ValueError("HOST must be a valid IP or 'localhost'")
 
     @field_validator("PORT", mode="before")
     @classmethod
@@ -53,7 +59,8 @@ class Env(BaseModel):
         msg = "PORT must be an integer between 1 and 65535"
         if isinstance(value, str):
             stripped = value.strip()
-            if not stripped.isdigit():
+            # ASCII digits only: int() alone would also take "+8080", "80_80" and non-ASCII digits.
+            if not (stripped.isascii() and stripped.isdigit()):
                 raise ValueError(msg)
             value = int(stripped)
         if not isinstance(value, int):
@@ -77,4 +84,4 @@ class Env(BaseModel):
         return [cp.strip() for cp in value.split(",") if cp.strip()]
 
 
-env = Env.model_validate(os.environ)
+env = TypeAdapter(Env).validate_python(dict(os.environ))
@@ -34,3 +34,11 @@ def make_error(error: str, detail: str | Exception | None = None) -> ErrorRespon
     if msg:
         return {"error": error, "details": msg}
     return {"error": error}
+
+
+def make_error_from_exc(error: str, exc: BaseException) -> ErrorResponse:
+    """make_error specialized for call sites that always hold an exception (handlers, 500 wraps)."""
+    msg = str(exc)
+    if msg:
+        return {"error": error, "details": msg}
+    return {"error": error}
@@ -101,6 +101,16 @@ def parse_compute_rounds(value: str | None) -> int | None:
     return n if 1 <= n <= _I64_MAX else None
 
 
+def summarize_validation_error(e: ValidationError) -> str:
+    """Short "<n> validation error(s)" summary of a pydantic ValidationError.
+
+    Used for /validate details and for any stray ValidationError a server reports
+    as a 500. Its str() would render every error with its input and a docs URL.
+    """
+    count = e.error_count()
+    return f"{count} validation error{'s' if count != 1 else ''}"
+
+
 def validate_payload(raw: bytes) -> str | None:
     """Validate the raw request body against the /validate schema.
 
@@ -113,6 +123,5 @@ def validate_payload(raw: bytes) -> str | None:
     try:
         _ValidatePayload.model_validate_json(raw)
     except ValidationError as e:
-        count = e.error_count()
-        return f"{count} validation error{'s' if count != 1 else ''}"
+        return summarize_validation_error(e)
     return None